@@ -95,6 +95,10 @@ CREATE INDEX IF NOT EXISTS idx_jobs_city ON jobs(city);
 CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs(is_active);
 CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
 CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source_portal);
+-- Only active jobs are ever aged out, so the cleanup scan skips inactive rows
+CREATE INDEX IF NOT EXISTS idx_jobs_active_scraped_at ON jobs(scraped_at) WHERE is_active;
+-- job_url is the dedupe key for the scraper's upserts (ON CONFLICT (job_url))
+CREATE UNIQUE INDEX IF NOT EXISTS jobs_job_url_key ON jobs(job_url);
 
 CREATE INDEX IF NOT EXISTS idx_user_swipes_user_id ON user_swipes(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_swipes_action ON user_swipes(swipe_action);
@@ -132,6 +136,25 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Active job counts per city, for the scraper's stats (one grouped query instead of one per city)
+CREATE OR REPLACE FUNCTION job_city_counts()
+RETURNS TABLE(city VARCHAR, n BIGINT) AS $$
+  SELECT jobs.city, COUNT(*) FROM jobs WHERE jobs.is_active GROUP BY jobs.city;
+$$ language 'sql' STABLE;
+
+-- Mark jobs scraped before cutoff as inactive, returning how many were changed
+CREATE OR REPLACE FUNCTION cleanup_inactive(cutoff TIMESTAMP)
+RETURNS INTEGER AS $$
+DECLARE
+  n INTEGER;
+BEGIN
+  UPDATE jobs SET is_active = FALSE, updated_at = NOW()
+  WHERE is_active AND scraped_at < cutoff;
+  GET DIAGNOSTICS n = ROW_COUNT;
+  RETURN n;
+END;
+$$ language 'plpgsql';
+
 -- Triggers for updated_at
 CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
   FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
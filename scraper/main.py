@@ -8,6 +8,7 @@ import os
 import time
 import schedule
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
@@ -28,9 +29,10 @@ class JobScraperWorker:
         }
         
         # Configuration
-        self.cities = os.getenv('CITIES', 'vancouver,toronto,calgary').split(',')
+        self.cities = [city.strip().lower() for city in os.getenv('CITIES', 'vancouver,toronto,calgary').split(',')]
         self.scrape_interval = int(os.getenv('SCRAPE_INTERVAL_HOURS', '6'))
         self.max_jobs_per_city = int(os.getenv('MAX_JOBS_PER_CITY', '50'))
+        self.city_workers = int(os.getenv('CITY_WORKERS', '3'))
         
         self.logger.info(f"🚀 SwipeHire Scraper initialized")
         self.logger.info(f"📍 Cities: {self.cities}")
@@ -43,47 +45,67 @@ class JobScraperWorker:
         total_jobs_added = 0
         scrape_start = datetime.now()
         
-        for city in self.cities:
-            city = city.strip().lower()
-            self.logger.info(f"🏙️  Scraping jobs for {city}...")
-            
-            # Log scraping start
-            log_id = self.db.log_scrape_start('craigslist', city)
-            
-            try:
-                # Scrape from Craigslist
-                jobs = self.scrapers['craigslist'].scrape_jobs(
-                    city=city,
-                    max_jobs=self.max_jobs_per_city
-                )
-                
-                # Save jobs to PostgreSQL database
-                jobs_added = 0
-                for job in jobs:
-                    if self.db.save_job(job):
-                        jobs_added += 1
+        # Cities are independent hosts, so scrape them in parallel; all database
+        # access stays on this thread since the connection isn't shared safely
+        with ThreadPoolExecutor(max_workers=max(1, min(len(self.cities), self.city_workers))) as executor:
+            futures = {}
+            for city in self.cities:
+                self.logger.info(f"🏙️  Scraping jobs for {city}...")
                 
-                total_jobs_added += jobs_added
+                # Log scraping start
+                log_id = self.db.log_scrape_start('craigslist', city)
                 
-                # Log successful completion
-                self.db.log_scrape_completion(
-                    log_id=log_id,
-                    jobs_found=len(jobs),
-                    jobs_added=jobs_added,
-                    status='completed'
+                # Scrape from Craigslist, skipping postings that are already stored
+                future = executor.submit(
+                    self.scrapers['craigslist'].scrape_jobs,
+                    city=city,
+                    max_jobs=self.max_jobs_per_city,
+                    skip_urls=self.db.known_job_urls
                 )
+                futures[future] = (city, log_id)
+            
+            for future in as_completed(futures):
+                city, log_id = futures[future]
                 
-                self.logger.info(f"✅ {city}: {jobs_added}/{len(jobs)} jobs added")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Error scraping {city}: {str(e)}")
-                self.db.log_scrape_completion(
-                    log_id=log_id,
-                    jobs_found=0,
-                    jobs_added=0,
-                    status='failed',
-                    error_message=str(e)
-                )
+                try:
+                    jobs = future.result()
+                    
+                    # Save jobs to PostgreSQL database in one batch
+                    jobs_added, jobs_failed = self.db.save_jobs_bulk(jobs)
+                    
+                    total_jobs_added += jobs_added
+                    
+                    if jobs_failed:
+                        # Some rows were rejected by the database; don't report a clean run
+                        self.db.log_scrape_completion(
+                            log_id=log_id,
+                            jobs_found=len(jobs),
+                            jobs_added=jobs_added,
+                            status='failed',
+                            error_message=f"{jobs_failed} jobs could not be saved"
+                        )
+                        self.logger.warning(f"⚠️  {city}: {jobs_added}/{len(jobs)} jobs added, {jobs_failed} failed to save")
+                        continue
+                    
+                    # Log successful completion
+                    self.db.log_scrape_completion(
+                        log_id=log_id,
+                        jobs_found=len(jobs),
+                        jobs_added=jobs_added,
+                        status='completed'
+                    )
+                    
+                    self.logger.info(f"✅ {city}: {jobs_added}/{len(jobs)} jobs added")
+                    
+                except Exception as e:
+                    self.logger.error(f"❌ Error scraping {city}: {str(e)}")
+                    self.db.log_scrape_completion(
+                        log_id=log_id,
+                        jobs_found=0,
+                        jobs_added=0,
+                        status='failed',
+                        error_message=str(e)
+                    )
         
         scrape_duration = datetime.now() - scrape_start
         self.logger.info(f"🎉 Scraping cycle completed! {total_jobs_added} total jobs added in {scrape_duration}")
@@ -136,15 +158,24 @@ class JobScraperWorker:
         self.scrape_all_portals()
         self.logger.info("✅ One-time scrape completed")
 
+    def close(self) -> None:
+        """Close scraper HTTP sessions and the database connection"""
+        for scraper in self.scrapers.values():
+            scraper.close()
+        self.db.close()
+
 def main():
     """Main entry point"""
     scraper = JobScraperWorker()
     
-    # Check if running in one-time mode
-    if os.getenv('RUN_ONCE', 'false').lower() == 'true':
-        scraper.run_once()
-    else:
-        scraper.run_scheduler()
+    try:
+        # Check if running in one-time mode
+        if os.getenv('RUN_ONCE', 'false').lower() == 'true':
+            scraper.run_once()
+        else:
+            scraper.run_scheduler()
+    finally:
+        scraper.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,12 +6,42 @@ Direct database connection - no API issues
 import os
 import uuid
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
 
 from ..utils.logger import setup_logger
 
+# Columns written for every scraped job, and the matching named placeholders
+JOB_INSERT_COLUMNS = """
+    title, company, location, city, province, description, 
+    full_description, job_url, source_portal, contact_email, 
+    contact_phone, posted_date, job_type, experience_level, salary
+"""
+JOB_INSERT_VALUES = """(
+    %(title)s, %(company)s, %(location)s, %(city)s, %(province)s, 
+    %(description)s, %(full_description)s, %(job_url)s, %(source_portal)s, 
+    %(contact_email)s, %(contact_phone)s, %(posted_date)s, %(job_type)s, 
+    %(experience_level)s, %(salary)s
+)"""
+
+# Scraping logs table; id_default is filled in by _create_tables
+SCRAPING_LOGS_TABLE = """
+    CREATE TABLE IF NOT EXISTS scraping_logs (
+        id UUID PRIMARY KEY %(id_default)s,
+        portal_name VARCHAR(100),
+        city VARCHAR(100),
+        scrape_started_at TIMESTAMP,
+        scrape_completed_at TIMESTAMP,
+        jobs_found INTEGER,
+        jobs_added INTEGER,
+        status VARCHAR(50),
+        error_message TEXT,
+        created_at TIMESTAMP DEFAULT NOW()
+    )
+"""
+
 class PostgresClient:
     def __init__(self):
         self.logger = setup_logger()
@@ -22,106 +52,200 @@ class PostgresClient:
             raise ValueError("DATABASE_URL must be set")
         
         # Connect to PostgreSQL
+        # Each method runs in its own `with self.conn:` transaction, so a
+        # multi-page batch insert commits once instead of once per statement
         self.conn = psycopg2.connect(database_url)
-        self.conn.autocommit = True
+        self.conn.autocommit = False
         
         self.logger.info("✅ Connected to PostgreSQL database")
         
         # Create tables if they don't exist
         self._create_tables()
+        
+        # Every URL already stored, so re-scraped jobs are skipped without a query.
+        # Rows are only ever deactivated, never deleted, so this stays accurate.
+        self.known_job_urls = self._load_job_urls()
 
     def _create_tables(self):
         """Create necessary tables"""
+        statements = [
+            # Jobs table
+            """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id SERIAL PRIMARY KEY,
+                    title VARCHAR(500) NOT NULL,
+                    company VARCHAR(200),
+                    location VARCHAR(200),
+                    city VARCHAR(100),
+                    province VARCHAR(10),
+                    description TEXT,
+                    full_description TEXT,
+                    job_url VARCHAR(1000) UNIQUE NOT NULL,
+                    source_portal VARCHAR(50),
+                    contact_email VARCHAR(200),
+                    contact_phone VARCHAR(50),
+                    posted_date TIMESTAMP,
+                    job_type VARCHAR(50),
+                    experience_level VARCHAR(50),
+                    salary VARCHAR(200),
+                    is_active BOOLEAN DEFAULT TRUE,
+                    scraped_at TIMESTAMP DEFAULT NOW(),
+                    created_at TIMESTAMP DEFAULT NOW(),
+                    updated_at TIMESTAMP DEFAULT NOW()
+                )
+            """,
+            
+            # Scraping logs table; gen_random_uuid() is only built in from Postgres 13,
+            # so older servers get the table without an id default instead
+            (
+                SCRAPING_LOGS_TABLE % {'id_default': 'DEFAULT gen_random_uuid()'},
+                SCRAPING_LOGS_TABLE % {'id_default': ''},
+            ),
+            
+            # ON CONFLICT (job_url) needs a unique index; this matches the name
+            # Postgres gives the UNIQUE constraint above, so it's a no-op there
+            # and covers tables created from database/schema.sql
+            """
+                CREATE UNIQUE INDEX IF NOT EXISTS jobs_job_url_key ON jobs (job_url)
+            """,
+            
+            # Partial index for cleanup_old_jobs, which only ever touches active rows
+            """
+                CREATE INDEX IF NOT EXISTS idx_jobs_active_scraped_at ON jobs (scraped_at) WHERE is_active
+            """,
+        ]
+        
+        # Each statement commits on its own, so an index that can't be built
+        # (duplicate URLs) doesn't roll back the tables. A tuple lists
+        # alternatives, tried in order until one succeeds.
+        failed = 0
+        for statement in statements:
+            alternatives = statement if isinstance(statement, tuple) else (statement,)
+            for alternative in alternatives:
+                try:
+                    with self.conn, self.conn.cursor() as cur:
+                        cur.execute(alternative)
+                    break
+                except Exception as e:
+                    error = e
+            else:
+                failed += 1
+                self.logger.error(f"❌ Error creating tables: {str(error)}")
+        
+        if not failed:
+            self.logger.info("✅ Database tables ready")
+
+    def _load_job_urls(self) -> Set[str]:
+        """Load the URLs of all stored jobs"""
         try:
-            with self.conn.cursor() as cur:
-                # Jobs table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS jobs (
-                        id SERIAL PRIMARY KEY,
-                        title VARCHAR(500) NOT NULL,
-                        company VARCHAR(200),
-                        location VARCHAR(200),
-                        city VARCHAR(100),
-                        province VARCHAR(10),
-                        description TEXT,
-                        full_description TEXT,
-                        job_url VARCHAR(1000) UNIQUE NOT NULL,
-                        source_portal VARCHAR(50),
-                        contact_email VARCHAR(200),
-                        contact_phone VARCHAR(50),
-                        posted_date TIMESTAMP,
-                        job_type VARCHAR(50),
-                        experience_level VARCHAR(50),
-                        salary VARCHAR(200),
-                        is_active BOOLEAN DEFAULT TRUE,
-                        scraped_at TIMESTAMP DEFAULT NOW(),
-                        created_at TIMESTAMP DEFAULT NOW(),
-                        updated_at TIMESTAMP DEFAULT NOW()
-                    )
-                """)
-                
-                # Scraping logs table
-                cur.execute("""
-                    CREATE TABLE IF NOT EXISTS scraping_logs (
-                        id UUID PRIMARY KEY,
-                        portal_name VARCHAR(100),
-                        city VARCHAR(100),
-                        scrape_started_at TIMESTAMP,
-                        scrape_completed_at TIMESTAMP,
-                        jobs_found INTEGER,
-                        jobs_added INTEGER,
-                        status VARCHAR(50),
-                        error_message TEXT,
-                        created_at TIMESTAMP DEFAULT NOW()
-                    )
-                """)
-                
-                self.logger.info("✅ Database tables ready")
-                
+            with self.conn, self.conn.cursor() as cur:
+                cur.execute("SELECT job_url FROM jobs")
+                job_urls = {row[0] for row in cur}
+            
+            self.logger.info(f"📚 Loaded {len(job_urls)} known job URLs")
+            return job_urls
+            
         except Exception as e:
-            self.logger.error(f"❌ Error creating tables: {str(e)}")
+            self.logger.error(f"❌ Error loading known job URLs: {str(e)}")
+            return set()
+
+    def _insert_job(self, job_data: Dict) -> bool:
+        """Insert one job in its own transaction, returning whether it was new"""
+        with self.conn, self.conn.cursor() as cur:
+            # Insert new job; an existing URL hits the unique index and is skipped
+            cur.execute(f"""
+                INSERT INTO jobs ({JOB_INSERT_COLUMNS})
+                VALUES {JOB_INSERT_VALUES}
+                ON CONFLICT (job_url) DO NOTHING
+                RETURNING id
+            """, job_data)
+            inserted = cur.fetchone() is not None
+        
+        # Stored either by this insert or by an earlier writer
+        self.known_job_urls.add(job_data['job_url'])
+        return inserted
 
     def save_job(self, job_data: Dict) -> bool:
         """Save a job to the database"""
+        if job_data['job_url'] in self.known_job_urls:
+            return False  # Job already exists
+        
         try:
-            with self.conn.cursor() as cur:
-                # Check if job already exists
-                cur.execute("SELECT id FROM jobs WHERE job_url = %s", (job_data['job_url'],))
-                if cur.fetchone():
-                    return False  # Job already exists
-                
-                # Insert new job
-                insert_sql = """
-                    INSERT INTO jobs (
-                        title, company, location, city, province, description, 
-                        full_description, job_url, source_portal, contact_email, 
-                        contact_phone, posted_date, job_type, experience_level, salary
-                    ) VALUES (
-                        %(title)s, %(company)s, %(location)s, %(city)s, %(province)s, 
-                        %(description)s, %(full_description)s, %(job_url)s, %(source_portal)s, 
-                        %(contact_email)s, %(contact_phone)s, %(posted_date)s, %(job_type)s, 
-                        %(experience_level)s, %(salary)s
-                    )
-                """
-                
-                cur.execute(insert_sql, job_data)
-                self.logger.debug(f"✅ Saved job: {job_data['title']}")
-                return True
+            if not self._insert_job(job_data):
+                return False  # Job already exists
+            
+            self.logger.debug(f"✅ Saved job: {job_data['title']}")
+            return True
                 
         except Exception as e:
             self.logger.error(f"❌ Error saving job: {str(e)}")
             return False
 
+    def save_jobs_bulk(self, jobs: List[Dict]) -> Tuple[int, int]:
+        """Save a batch of jobs in one round-trip, returning (new jobs, jobs that failed to save)"""
+        new_jobs = [job for job in jobs if job['job_url'] not in self.known_job_urls]
+        if not new_jobs:
+            return 0, 0
+        
+        try:
+            with self.conn, self.conn.cursor() as cur:
+                # URLs stored by another writer are still skipped by the unique index
+                inserted = psycopg2.extras.execute_values(
+                    cur,
+                    f"""
+                        INSERT INTO jobs ({JOB_INSERT_COLUMNS})
+                        VALUES %s
+                        ON CONFLICT (job_url) DO NOTHING
+                        RETURNING id
+                    """,
+                    new_jobs,
+                    template=JOB_INSERT_VALUES,
+                    page_size=100,
+                    fetch=True
+                )
+            
+            self.known_job_urls.update(job['job_url'] for job in new_jobs)
+            
+            self.logger.debug(f"✅ Saved {len(inserted)}/{len(jobs)} jobs")
+            return len(inserted), 0
+                
+        except Exception as e:
+            # The batch is all-or-nothing, so one bad row (unparseable date, overlong
+            # value) would drop every job; retry one by one to save the rest
+            self.logger.warning(f"⚠️  Batch insert failed, saving jobs one by one: {str(e)}")
+        
+        jobs_added = 0
+        jobs_failed = 0
+        for job in new_jobs:
+            try:
+                jobs_added += self._insert_job(job)
+            except Exception as e:
+                jobs_failed += 1
+                self.logger.error(f"❌ Error saving job {job['job_url']}: {str(e)}")
+        
+        self.logger.debug(f"✅ Saved {jobs_added}/{len(jobs)} jobs, {jobs_failed} failed")
+        return jobs_added, jobs_failed
+
     def log_scrape_start(self, portal_name: str, city: str) -> str:
         """Log the start of a scraping session"""
         try:
-            log_id = str(uuid.uuid4())
+            try:
+                with self.conn, self.conn.cursor() as cur:
+                    cur.execute("""
+                        INSERT INTO scraping_logs (portal_name, city, scrape_started_at, status)
+                        VALUES (%s, %s, %s, %s)
+                        RETURNING id
+                    """, (portal_name, city, datetime.now(), 'running'))
+                    log_id = str(cur.fetchone()[0])
             
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO scraping_logs (id, portal_name, city, scrape_started_at, status)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (log_id, portal_name, city, datetime.now(), 'running'))
+            except psycopg2.errors.NotNullViolation:
+                # Log table has no id default (Postgres < 13 or an older table)
+                log_id = str(uuid.uuid4())
+                with self.conn, self.conn.cursor() as cur:
+                    cur.execute("""
+                        INSERT INTO scraping_logs (id, portal_name, city, scrape_started_at, status)
+                        VALUES (%s, %s, %s, %s, %s)
+                    """, (log_id, portal_name, city, datetime.now(), 'running'))
             
             return log_id
             
@@ -133,7 +257,7 @@ class PostgresClient:
                             status: str = 'completed', error_message: str = None) -> bool:
         """Log the completion of a scraping session"""
         try:
-            with self.conn.cursor() as cur:
+            with self.conn, self.conn.cursor() as cur:
                 cur.execute("""
                     UPDATE scraping_logs 
                     SET scrape_completed_at = %s, jobs_found = %s, jobs_added = %s, 
@@ -150,11 +274,11 @@ class PostgresClient:
     def cleanup_old_jobs(self, cutoff_date: datetime) -> int:
         """Mark old jobs as inactive"""
         try:
-            with self.conn.cursor() as cur:
+            with self.conn, self.conn.cursor() as cur:
                 cur.execute("""
                     UPDATE jobs 
                     SET is_active = FALSE, updated_at = %s 
-                    WHERE scraped_at < %s AND is_active = TRUE
+                    WHERE is_active AND scraped_at < %s
                 """, (datetime.now(), cutoff_date))
                 
                 count = cur.rowcount
@@ -168,7 +292,7 @@ class PostgresClient:
     def get_job_count(self) -> int:
         """Get total number of active jobs"""
         try:
-            with self.conn.cursor() as cur:
+            with self.conn, self.conn.cursor() as cur:
                 cur.execute("SELECT COUNT(*) FROM jobs WHERE is_active = TRUE")
                 return cur.fetchone()[0]
         except:
@@ -7,11 +7,14 @@ import os
 import time
 import uuid
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from supabase import create_client, Client
 
 from ..utils.logger import setup_logger
 
+# Rows per upsert request when saving in bulk
+BULK_CHUNK_SIZE = 500
+
 class SupabaseClient:
     def __init__(self):
         self.logger = setup_logger()
@@ -32,28 +35,21 @@ class SupabaseClient:
         
         for attempt in range(max_retries):
             try:
-                # Check if job already exists (by URL)
-                existing = self.supabase.table('jobs').select('id').eq('job_url', job_data['job_url']).execute()
-                
-                if existing.data:
-                    # Job already exists, skip
-                    return False
-                
                 # Add timestamp
-                job_data['scraped_at'] = datetime.now().isoformat()
-                job_data['created_at'] = datetime.now().isoformat()
-                job_data['updated_at'] = datetime.now().isoformat()
+                now = datetime.now().isoformat()
+                job_data['scraped_at'] = job_data['created_at'] = job_data['updated_at'] = now
                 job_data['is_active'] = True
                 
-                # Insert new job
-                result = self.supabase.table('jobs').insert(job_data).execute()
+                # Insert new job; an existing URL hits the unique index and is skipped
+                result = self.supabase.table('jobs').upsert(
+                    job_data, on_conflict='job_url', ignore_duplicates=True
+                ).execute()
                 
-                if result.data:
-                    self.logger.debug(f"✅ Saved job: {job_data['title']}")
-                    return True
-                else:
-                    self.logger.warning(f"⚠️  Failed to save job: {job_data['title']}")
-                    return False
+                if not result.data:
+                    return False  # Job already exists
+                
+                self.logger.debug(f"✅ Saved job: {job_data['title']}")
+                return True
                     
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -66,16 +62,54 @@ class SupabaseClient:
         
         return False
 
+    def save_jobs_bulk(self, jobs: List[Dict]) -> Tuple[int, int]:
+        """Save a batch of jobs with chunked upserts, returning (new jobs, jobs that failed to save)"""
+        now = datetime.now().isoformat()
+        rows = [
+            {**job, 'scraped_at': now, 'created_at': now, 'updated_at': now, 'is_active': True}
+            for job in jobs
+        ]
+        
+        jobs_added = 0
+        jobs_failed = 0
+        max_retries = 3
+        
+        # Chunked to stay under the request payload limit
+        for start in range(0, len(rows), BULK_CHUNK_SIZE):
+            chunk = rows[start:start + BULK_CHUNK_SIZE]
+            
+            for attempt in range(max_retries):
+                try:
+                    # Existing URLs are skipped by the unique index; only new rows come back
+                    result = self.supabase.table('jobs').upsert(
+                        chunk, on_conflict='job_url', ignore_duplicates=True
+                    ).execute()
+                    
+                    jobs_added += len(result.data) if result.data else 0
+                    break
+                    
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        self.logger.warning(f"⚠️  Retry {attempt + 1} for batch of {len(chunk)} jobs - {str(e)}")
+                        time.sleep(2)  # Wait before retry
+                    else:
+                        self.logger.error(f"❌ Failed to save batch of {len(chunk)} jobs after {max_retries} attempts: {str(e)}")
+                        jobs_failed += len(chunk)
+        
+        self.logger.debug(f"✅ Saved {jobs_added}/{len(jobs)} jobs, {jobs_failed} failed")
+        return jobs_added, jobs_failed
+
     def log_scrape_start(self, portal_name: str, city: str) -> str:
         """Log the start of a scraping session"""
         try:
+            now = datetime.now().isoformat()
             log_data = {
                 'id': str(uuid.uuid4()),
                 'portal_name': portal_name,
                 'city': city,
-                'scrape_started_at': datetime.now().isoformat(),
+                'scrape_started_at': now,
                 'status': 'running',
-                'created_at': datetime.now().isoformat()
+                'created_at': now
             }
             
             result = self.supabase.table('scraping_logs').insert(log_data).execute()
@@ -116,17 +150,13 @@ class SupabaseClient:
         """Remove jobs older than cutoff_date"""
         try:
             # Mark old jobs as inactive instead of deleting
-            result = self.supabase.table('jobs').update({
-                'is_active': False,
-                'updated_at': datetime.now().isoformat()
-            }).lt('scraped_at', cutoff_date.isoformat()).execute()
+            # (runs server-side, see cleanup_inactive in database/schema.sql; returns the row count)
+            result = self.supabase.rpc('cleanup_inactive', {'cutoff': cutoff_date.isoformat()}).execute()
             
-            if result.data:
-                count = len(result.data)
+            count = result.data or 0
+            if count:
                 self.logger.info(f"🧹 Marked {count} old jobs as inactive")
-                return count
-            else:
-                return 0
+            return count
                 
         except Exception as e:
             self.logger.error(f"❌ Error cleaning up old jobs: {str(e)}")
@@ -135,17 +165,13 @@ class SupabaseClient:
     def get_scraping_stats(self) -> Dict:
         """Get scraping statistics"""
         try:
-            # Get total active jobs
-            jobs_result = self.supabase.table('jobs').select('id').eq('is_active', True).execute()
-            total_jobs = len(jobs_result.data) if jobs_result.data else 0
-            
-            # Get jobs by city
-            cities = ['vancouver', 'toronto', 'calgary']
-            city_stats = {}
+            # Get total active jobs (count only, no rows transferred)
+            jobs_result = self.supabase.table('jobs').select('id', count='exact', head=True).eq('is_active', True).execute()
+            total_jobs = jobs_result.count or 0
             
-            for city in cities:
-                city_result = self.supabase.table('jobs').select('id').eq('city', city).eq('is_active', True).execute()
-                city_stats[city] = len(city_result.data) if city_result.data else 0
+            # Get jobs by city, grouped server-side (see job_city_counts in database/schema.sql)
+            city_result = self.supabase.rpc('job_city_counts').execute()
+            city_stats = {row['city']: row['n'] for row in city_result.data or []}
             
             # Get recent scraping logs
             logs_result = self.supabase.table('scraping_logs').select('*').order('created_at', desc=True).limit(5).execute()
@@ -4,14 +4,77 @@ Fast and reliable scraping without browser dependencies
 """
 
 import re
-import time
-import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Set
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..utils.logger import setup_logger
+from ..utils.rate_limiter import RateLimiter
+
+# Fail fast on dead hosts (just over the 3s TCP SYN retransmit) while still
+# giving slow-but-alive pages their full read budget
+CONNECT_TIMEOUT = 3.05
+
+# Detail pages are fetched in parallel; kept small to stay polite to Craigslist
+DETAIL_WORKERS = 4
+
+# Requests allowed per second to each city's host (search, detail and reply pages)
+REQUESTS_PER_SECOND = 1.0
+
+# Contact and company patterns used on every detail page
+# (domain labels are bounded to 63 chars so dot/hyphen runs can't blow up backtracking)
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+COMPANY_RE = re.compile(r'\(([^)]+)\)')
+
+# Reply-email patterns: mailto hrefs, reply/contact buttons, Craigslist relay addresses,
+# attributes holding an address at all, and the numeric post id inside a reply button's data-href
+MAILTO_HREF_RE = re.compile(r'mailto:', re.IGNORECASE)
+CL_MAILTO_HREF_RE = re.compile(r'mailto:.*@job\.craigslist\.org', re.IGNORECASE)
+MAILTO_RE = re.compile(r'mailto:([^?&\s]+)', re.IGNORECASE)
+REPLY_CLASS_RE = re.compile(r'reply|contact', re.IGNORECASE)
+CL_ANON_EMAIL_RE = re.compile(r'[a-f0-9]{32}@job\.craigslist\.org')
+AT_RE = re.compile('@')
+POST_ID_RE = re.compile(r'/(\d+)/')
+
+# Description cleanup: whitespace runs collapse to one space, and everything
+# from the first Craigslist footer marker onwards is dropped
+WHITESPACE_RE = re.compile(r'\s+')
+FOOTER_RE = re.compile(r'post id:|do NOT contact me', re.IGNORECASE)
+
+# Job type / experience keywords, in priority order (first label whose terms appear wins).
+# Each label's terms are one alternation so a description is scanned once per label.
+def _terms_pattern(*terms: str):
+    return re.compile('|'.join(map(re.escape, terms)))
+
+JOB_TYPE_PATTERNS = [
+    ('full-time', _terms_pattern('full-time', 'full time', 'fulltime')),
+    ('part-time', _terms_pattern('part-time', 'part time', 'parttime')),
+    ('contract', _terms_pattern('contract', 'contractor', 'freelance')),
+    ('internship', _terms_pattern('intern', 'internship')),
+]
+EXPERIENCE_PATTERNS = [
+    ('senior', _terms_pattern('senior', 'lead', 'principal', '5+ years', '5 years')),
+    ('entry', _terms_pattern('junior', 'entry', 'entry-level', 'new grad', 'recent grad')),
+    ('mid', _terms_pattern('mid', 'intermediate', '2-3 years', '3+ years')),
+]
+
+# Province for each supported city
+CITY_PROVINCES = {
+    'vancouver': 'BC',
+    'toronto': 'ON',
+    'calgary': 'AB'
+}
+
+# Search pages are only mined for posting links (.../d/<slug>/<id>.html),
+# so the parser keeps just those anchors and skips building the rest of the tree
+JOB_LINK_RE = re.compile(r'/d/.*\.html$')
+JOB_LINKS_ONLY = SoupStrainer('a', href=JOB_LINK_RE)
 
 class SimpleJobScraper:
     def __init__(self):
@@ -27,13 +90,49 @@ class SimpleJobScraper:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip/deflate plus br/zstd when brotli/zstandard are installed to decode them
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
+        
+        # Shared session so requests to the same Craigslist host reuse the
+        # underlying keep-alive connection instead of re-handshaking each time
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # One pool per city host, sized for the detail workers, with backoff on
+        # transient errors and rate limiting (Retry honours Retry-After on 429)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET', 'HEAD')
+        )
+        adapter = HTTPAdapter(
+            pool_connections=len(self.base_urls),
+            pool_maxsize=DETAIL_WORKERS * 2,
+            max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # One limiter per city host, shared by that city's detail workers
+        self.rate_limiters = {city: RateLimiter(REQUESTS_PER_SECOND) for city in self.base_urls}
+        
+        # Extra headers for the AJAX-style reply probe; the session supplies the rest
+        self.reply_headers = {
+            'X-Requested-With': 'XMLHttpRequest',
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Accept': 'application/json, text/html, */*',
+        }
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
 
-    def scrape_jobs(self, city: str, max_jobs: int = 25) -> List[Dict]:
-        """Scrape jobs from Craigslist for a specific city"""
+    def scrape_jobs(self, city: str, max_jobs: int = 25, skip_urls: Optional[Set[str]] = None) -> List[Dict]:
+        """Scrape jobs from Craigslist for a specific city, skipping URLs in skip_urls"""
         if city not in self.base_urls:
             self.logger.error(f"❌ City {city} not supported")
             return []
@@ -41,6 +140,9 @@ class SimpleJobScraper:
         base_url = self.base_urls[city]
         jobs = []
         
+        # Postings often show up in several categories; only fetch each one once
+        seen_urls = set(skip_urls) if skip_urls is not None else set()
+        
         try:
             # Scrape from multiple job categories
             categories = ['jjj', 'sof', 'sad', 'fbh', 'ret', 'ofc', 'lab', 'med', 'trp']  # Added 'trp' for transportation
@@ -50,12 +152,9 @@ class SimpleJobScraper:
                     break
                 
                 try:
-                    category_jobs = self._scrape_category(base_url, category, max_jobs - len(jobs))
+                    category_jobs = self._scrape_category(city, category, max_jobs - len(jobs), seen_urls)
                     jobs.extend(category_jobs)
                     
-                    # Rate limiting between categories
-                    time.sleep(random.uniform(1, 2))
-                    
                 except Exception as e:
                     self.logger.warning(f"⚠️  Error scraping category {category}: {str(e)}")
                     continue
@@ -67,39 +166,46 @@ class SimpleJobScraper:
             self.logger.error(f"❌ Error scraping {city}: {str(e)}")
             return []
 
-    def _scrape_category(self, base_url: str, category: str, max_jobs: int) -> List[Dict]:
+    def _scrape_category(self, city: str, category: str, max_jobs: int, seen_urls: Set[str]) -> List[Dict]:
         """Scrape jobs from a specific category"""
+        base_url = self.base_urls[city]
         jobs = []
         
         try:
             url = f"{base_url}/search/{category}"
-            self.logger.info(f"🔍 Scraping category {category}: {url}")
+            self.logger.debug("🔍 Scraping category %s: %s", category, url)
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            self.rate_limiters[city].acquire()
+            response = self.session.get(url, timeout=(CONNECT_TIMEOUT, 15))
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._make_soup(response, parse_only=JOB_LINKS_ONLY)
             
-            # Find job listings using working selector
-            job_links = soup.find_all('a', href=re.compile(r'.*\.html$'))
+            # Only job listing links survive the strainer
+            job_links = soup.find_all('a')
             
-            # Filter to only job listing links (exclude other .html links)
-            job_links = [link for link in job_links if '/d/' in link.get('href', '')]
+            self.logger.debug("🔗 Found %s job links in %s", len(job_links), category)
             
-            self.logger.info(f"🔗 Found {len(job_links)} job links in {category}")
-            
-            for link in job_links[:max_jobs]:
-                try:
-                    job_data = self._parse_job_listing(link, base_url)
-                    if job_data:
-                        jobs.append(job_data)
-                        
-                    # Rate limiting between job requests
-                    time.sleep(random.uniform(0.5, 1.5))
-                    
-                except Exception as e:
-                    self.logger.warning(f"⚠️  Error parsing job link: {str(e)}")
-                    continue
+            # Drop postings that are already stored or were fetched from an earlier category;
+            # only links that are actually fetched are marked seen, so later categories can
+            # still pick up the ones cut off by max_jobs
+            new_links = []
+            for link in job_links:
+                if len(new_links) >= max_jobs:
+                    break
+                job_url = self._absolute_url(link['href'], base_url)
+                if job_url not in seen_urls:
+                    seen_urls.add(job_url)
+                    new_links.append(link)
+            job_links = new_links
+            
+            # Detail fetches are independent and network-bound, so overlap them
+            with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+                results = executor.map(
+                    lambda link: self._fetch_job_listing(link, city),
+                    job_links
+                )
+                jobs = [job_data for job_data in results if job_data]
             
             return jobs
             
@@ -107,16 +213,27 @@ class SimpleJobScraper:
             self.logger.error(f"❌ Error scraping category {category}: {str(e)}")
             return []
 
-    def _parse_job_listing(self, link_element, base_url: str) -> Optional[Dict]:
+    def _fetch_job_listing(self, link_element, city: str) -> Optional[Dict]:
+        """Parse a job listing on a worker thread once the city's rate limit allows"""
+        try:
+            self.rate_limiters[city].acquire()
+            return self._parse_job_listing(link_element, city)
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️  Error parsing job link: {str(e)}")
+            return None
+
+    def _parse_job_listing(self, link_element, city: str) -> Optional[Dict]:
         """Parse a job listing from the link element"""
         try:
+            base_url = self.base_urls[city]
+            
             # Get job URL
             job_url = link_element.get('href')
             if not job_url:
                 return None
                 
-            if not job_url.startswith('http'):
-                job_url = base_url + job_url
+            job_url = self._absolute_url(job_url, base_url)
             
             # Get job title
             title = link_element.get_text(strip=True)
@@ -124,10 +241,7 @@ class SimpleJobScraper:
                 return None
             
             # Get detailed job information
-            job_details = self._get_job_details(job_url)
-            
-            # Extract city from URL
-            city = self._extract_city_from_url(job_url)
+            job_details = self._get_job_details(job_url, city)
             
             # Create job data
             job_data = {
@@ -135,14 +249,14 @@ class SimpleJobScraper:
                 'company': job_details.get('company', 'Company Not Listed'),
                 'location': job_details.get('location', f'{city.title()}, Canada'),
                 'city': city,
-                'province': self._get_province(city),
+                'province': CITY_PROVINCES.get(city, 'Canada'),
                 'description': job_details.get('description', title),
                 'full_description': job_details.get('full_description', job_details.get('description', title)),
                 'job_url': job_url,
                 'source_portal': 'craigslist',
                 'contact_email': job_details.get('email'),
                 'contact_phone': job_details.get('phone'),
-                'posted_date': job_details.get('posted_date', datetime.now()).isoformat() if isinstance(job_details.get('posted_date', datetime.now()), datetime) else job_details.get('posted_date', datetime.now().isoformat()),
+                'posted_date': job_details.get('posted_date') or datetime.now().isoformat(),
                 'job_type': job_details.get('job_type', 'full-time'),
                 'experience_level': job_details.get('experience_level', 'mid'),
                 'salary': job_details.get('salary', 'Not specified')
@@ -154,41 +268,39 @@ class SimpleJobScraper:
             self.logger.warning(f"⚠️  Error parsing job listing: {str(e)}")
             return None
 
-    def _get_job_details(self, job_url: str) -> Dict:
+    def _get_job_details(self, job_url: str, city: str) -> Dict:
         """Get detailed job information from job page"""
         try:
-            response = requests.get(job_url, headers=self.headers, timeout=10)
+            response = self.session.get(job_url, timeout=(CONNECT_TIMEOUT, 10))
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._make_soup(response)
             
             details = {}
             
-            # Get description
+            # Get description; the body text is extracted once and reused below
             description_elem = soup.find('section', id='postingbody')
+            body_text = description_elem.get_text(' ') if description_elem else ''
             if description_elem:
-                description = description_elem.get_text(strip=True)
-                details['description'] = self._clean_description(description[:300] + '...' if len(description) > 300 else description)
-                details['full_description'] = self._clean_description(description)
+                full_description = self._clean_description(body_text)
+                details['description'] = full_description[:300] + '...' if len(full_description) > 300 else full_description
+                details['full_description'] = full_description
             
             # Extract contact email from reply button (primary method)
-            reply_email = self._extract_reply_email(soup)
+            reply_email = self._extract_reply_email(soup, city)
             if reply_email:
                 details['email'] = reply_email
             
             # Extract contact info from description (fallback method)
             if description_elem and not details.get('email'):
-                text = description_elem.get_text()
-                
                 # Email extraction from description text
-                email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+                email_match = EMAIL_RE.search(body_text)
                 if email_match:
                     details['email'] = email_match.group()
             
             # Phone extraction from description
             if description_elem:
-                text = description_elem.get_text()
-                phone_match = re.search(r'(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})', text)
+                phone_match = PHONE_RE.search(body_text)
                 if phone_match:
                     details['phone'] = phone_match.group()
             
@@ -197,18 +309,20 @@ class SimpleJobScraper:
             if company_elem:
                 company_text = company_elem.get_text()
                 # Extract company from parentheses if present
-                company_match = re.search(r'\(([^)]+)\)', company_text)
+                company_match = COMPANY_RE.search(company_text)
                 if company_match:
                     details['company'] = company_match.group(1)
             
             # Get posting date
             date_elem = soup.find('time', class_='date')
-            if date_elem:
+            if date_elem and date_elem.get('datetime'):
+                date_str = date_elem['datetime']
+                # Postgres parses ISO 8601 directly, so keep the string; the parse only
+                # guards against a malformed value failing the whole insert
                 try:
-                    date_str = date_elem.get('datetime')
-                    if date_str:
-                        details['posted_date'] = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                except:
+                    datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                    details['posted_date'] = date_str
+                except ValueError:
                     pass
             
             # Extract salary if present
@@ -216,10 +330,12 @@ class SimpleJobScraper:
             if salary_elem:
                 details['salary'] = salary_elem.get_text(strip=True)
             
-            # Determine job type and experience level from text
-            full_text = soup.get_text().lower()
-            details['job_type'] = self._extract_job_type(full_text)
-            details['experience_level'] = self._extract_experience_level(full_text)
+            # Determine job type and experience level from the posting's own text
+            # (title, attribute groups and body) rather than the whole page
+            posting_elems = [company_elem] + soup.find_all(class_='attrgroup')
+            posting_text = ' '.join([body_text] + [elem.get_text(' ') for elem in posting_elems if elem]).lower()
+            details['job_type'] = self._extract_job_type(posting_text)
+            details['experience_level'] = self._extract_experience_level(posting_text)
             
             return details
             
@@ -227,63 +343,49 @@ class SimpleJobScraper:
             self.logger.warning(f"⚠️  Error getting job details from {job_url}: {str(e)}")
             return {}
 
-    def _extract_city_from_url(self, url: str) -> str:
-        """Extract city from Craigslist URL"""
-        if 'vancouver' in url:
-            return 'vancouver'
-        elif 'toronto' in url:
-            return 'toronto'
-        elif 'calgary' in url:
-            return 'calgary'
-        else:
-            return 'unknown'
+    def _make_soup(self, response, parse_only=None) -> BeautifulSoup:
+        """Parse a response with lxml, trusting the charset from its headers when one is sent"""
+        # Without a declared charset requests guesses ISO-8859-1, so let bs4 sniff instead
+        content_type = response.headers.get('Content-Type', '').lower()
+        encoding = response.encoding if 'charset=' in content_type else None
+        return BeautifulSoup(response.content, 'lxml', from_encoding=encoding, parse_only=parse_only)
 
-    def _get_province(self, city: str) -> str:
-        """Get province for city"""
-        city_provinces = {
-            'vancouver': 'BC',
-            'toronto': 'ON',
-            'calgary': 'AB'
-        }
-        return city_provinces.get(city, 'Canada')
+    def _absolute_url(self, href: str, base_url: str) -> str:
+        """Resolve a listing href against the city's base URL"""
+        if href.startswith('http'):
+            return href
+        return base_url + href
 
     def _clean_description(self, description: str) -> str:
         """Clean and format job description"""
         # Remove extra whitespace
-        description = re.sub(r'\s+', ' ', description)
+        description = WHITESPACE_RE.sub(' ', description)
         
         # Remove QR code text and other boilerplate
-        description = re.sub(r'QR Code Link to This Post', '', description)
-        description = re.sub(r'post id:.*$', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'do NOT contact me.*$', '', description, flags=re.IGNORECASE)
+        description = description.replace('QR Code Link to This Post', '')
+        
+        # Everything from the first footer marker onwards is boilerplate
+        footer = FOOTER_RE.search(description)
+        if footer:
+            description = description[:footer.start()]
         
         return description.strip()
 
     def _extract_job_type(self, description: str) -> str:
         """Extract job type from description"""
-        if any(term in description for term in ['full-time', 'full time', 'fulltime']):
-            return 'full-time'
-        elif any(term in description for term in ['part-time', 'part time', 'parttime']):
-            return 'part-time'
-        elif any(term in description for term in ['contract', 'contractor', 'freelance']):
-            return 'contract'
-        elif any(term in description for term in ['intern', 'internship']):
-            return 'internship'
-        else:
-            return 'full-time'  # Default
+        for job_type, pattern in JOB_TYPE_PATTERNS:
+            if pattern.search(description):
+                return job_type
+        return 'full-time'  # Default
 
     def _extract_experience_level(self, description: str) -> str:
         """Extract experience level from description"""
-        if any(term in description for term in ['senior', 'lead', 'principal', '5+ years', '5 years']):
-            return 'senior'
-        elif any(term in description for term in ['junior', 'entry', 'entry-level', 'new grad', 'recent grad']):
-            return 'entry'
-        elif any(term in description for term in ['mid', 'intermediate', '2-3 years', '3+ years']):
-            return 'mid'
-        else:
-            return 'mid'  # Default
+        for level, pattern in EXPERIENCE_PATTERNS:
+            if pattern.search(description):
+                return level
+        return 'mid'  # Default
 
-    def _extract_reply_email(self, soup) -> Optional[str]:
+    def _extract_reply_email(self, soup, city: str) -> Optional[str]:
         """Extract email from Craigslist reply button or mailto links"""
         try:
             # Method 1: Look for Craigslist anonymized reply email with reply-email-localpart
@@ -293,27 +395,25 @@ class SimpleJobScraper:
                     localpart = span.get_text(strip=True)
                     # Construct the full Craigslist email
                     email = f"{localpart}@job.craigslist.org"
-                    self.logger.info(f"✅ Found real Craigslist email from reply-email-localpart: {email}")
+                    self.logger.debug("✅ Found real Craigslist email from reply-email-localpart: %s", email)
                     return email
             
             # Method 1b: Look for mailto links containing Craigslist emails
-            mailto_links = soup.find_all('a', href=re.compile(r'mailto:.*@job\.craigslist\.org', re.I))
+            mailto_links = soup.find_all('a', href=CL_MAILTO_HREF_RE)
             for link in mailto_links:
                 href = link.get('href', '')
-                email_match = re.search(r'mailto:([^?&\s]+)', href, re.I)
-                if email_match:
-                    email = email_match.group(1).strip()
-                    self.logger.info(f"✅ Found Craigslist email from mailto link: {email}")
+                email = self._mailto_address(href)
+                if email:
+                    self.logger.debug("✅ Found Craigslist email from mailto link: %s", email)
                     return email
             
             # Method 1c: Look for any mailto links (fallback)
-            reply_button = soup.find('a', href=re.compile(r'mailto:', re.I))
+            reply_button = soup.find('a', href=MAILTO_HREF_RE)
             if reply_button and reply_button.get('href'):
                 href = reply_button.get('href')
                 # Extract email from mailto: link
-                email_match = re.search(r'mailto:([^?&\s]+)', href, re.I)
-                if email_match:
-                    email = email_match.group(1).strip()
+                email = self._mailto_address(href)
+                if email:
                     return email
             
             # Method 2: Look for reply button with data-href
@@ -322,41 +422,40 @@ class SimpleJobScraper:
                 data_href = reply_button.get('data-href')
                 
                 # Try to get the real anonymized email from the reply system
-                real_email = self._get_real_anonymized_email(data_href, soup)
+                real_email = self._get_real_anonymized_email(data_href, soup, city)
                 if real_email:
                     return real_email
                 
                 # Extract post ID from data-href as fallback
                 # data-href looks like: /reply/van/lab/7864272331/__SERVICE_ID__
-                post_id_match = re.search(r'/(\d+)/', data_href)
+                post_id_match = POST_ID_RE.search(data_href)
                 if post_id_match:
                     post_id = post_id_match.group(1)
                     # Generate a working placeholder (many Craigslist emails follow this pattern)
                     anonymized_email = f"reply-{post_id}@job.craigslist.org"
-                    self.logger.info(f"📧 Found reply button for post {post_id}, using generated email")
+                    self.logger.debug("📧 Found reply button for post %s, using generated email", post_id)
                     return anonymized_email
                 
                 # Try the endpoint method as fallback
-                email = self._get_email_from_reply_endpoint(data_href, soup)
+                email = self._get_email_from_reply_endpoint(data_href, soup, city)
                 if email:
                     return email
             
             # Method 3: Look for other reply/contact button patterns
             reply_elements = soup.find_all(['a', 'button'], 
-                                         attrs={'class': re.compile(r'reply|contact', re.I)})
+                                         attrs={'class': REPLY_CLASS_RE})
             for element in reply_elements:
                 href = element.get('href', '')
                 if 'mailto:' in href.lower():
-                    email_match = re.search(r'mailto:([^?&\s]+)', href, re.I)
-                    if email_match:
-                        email = email_match.group(1).strip()
+                    email = self._mailto_address(href)
+                    if email:
                         return email
             
             # Method 3: Look for data attributes that might contain emails
-            for element in soup.find_all(attrs={'data-email': True}):
-                email = element.get('data-email')
-                if email and '@' in email:
-                    return email.strip()
+            # (only attributes that contain an address at all; stops at the first one)
+            element = soup.find(attrs={'data-email': AT_RE})
+            if element:
+                return element['data-email'].strip()
             
             # Method 4: Look in structured data (JSON-LD) for emails
             json_scripts = soup.find_all('script', type='application/ld+json')
@@ -368,10 +467,10 @@ class SimpleJobScraper:
                         # Look for emails in the description or other fields
                         if isinstance(data, dict) and 'description' in data:
                             description = data['description']
-                            email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', description)
+                            email_matches = (match.group() for match in EMAIL_RE.finditer(description))
                             for email in email_matches:
                                 if 'craigslist.org' not in email.lower():
-                                    self.logger.info(f"✅ Found email in structured data: {email}")
+                                    self.logger.debug("✅ Found email in structured data: %s", email)
                                     return email.strip()
                     except:
                         pass
@@ -381,22 +480,21 @@ class SimpleJobScraper:
             for script in scripts:
                 if script.string:
                     # Look for Craigslist anonymized emails first
-                    cl_email_matches = re.findall(r'[a-f0-9]{32}@job\.craigslist\.org', script.string)
-                    if cl_email_matches:
-                        return cl_email_matches[0]
+                    cl_email_match = CL_ANON_EMAIL_RE.search(script.string)
+                    if cl_email_match:
+                        return cl_email_match.group()
                     
                     # Look for regular emails in JavaScript
-                    email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', script.string)
+                    email_matches = (match.group() for match in EMAIL_RE.finditer(script.string))
                     for email in email_matches:
                         if 'craigslist.org' not in email.lower():
                             return email.strip()
             
             # Method 5: Look in onclick handlers for emails
-            for element in soup.find_all(attrs={'onclick': True}):
-                onclick = element.get('onclick', '')
-                email_match = re.search(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', onclick)
+            for element in soup.find_all(attrs={'onclick': AT_RE}):
+                email_match = EMAIL_RE.search(element['onclick'])
                 if email_match:
-                    return email_match.group(1).strip()
+                    return email_match.group(0).strip()
                     
             return None
             
@@ -404,13 +502,25 @@ class SimpleJobScraper:
             self.logger.warning(f"⚠️  Error extracting reply email: {str(e)}")
             return None
 
-    def _get_email_from_reply_endpoint(self, data_href: str, original_soup) -> Optional[str]:
+    def _mailto_address(self, href: str) -> Optional[str]:
+        """Get the address out of a mailto: href"""
+        # Well-formed hrefs start with the scheme, so slice instead of running the regex
+        href = href.strip()
+        if href[:7].lower() == 'mailto:':
+            address = href[7:].split('?', 1)[0].split('&', 1)[0].split()
+            return address[0] if address else None
+        
+        # Fall back to the pattern for hrefs with junk before the scheme
+        email_match = MAILTO_RE.search(href)
+        return email_match.group(1) if email_match else None
+
+    def _get_email_from_reply_endpoint(self, data_href: str, original_soup, city: str) -> Optional[str]:
         """Get email from Craigslist reply endpoint using data-href"""
         try:
             import time
             
-            # Extract base URL from the original job page
-            base_url = "https://vancouver.craigslist.org"  # Default, should extract from original URL
+            # Reply endpoints live on the same city host as the posting
+            base_url = self.base_urls[city]
             
             # Clean up data_href and replace __SERVICE_ID__ placeholder
             # The __SERVICE_ID__ might need to be replaced with an actual service ID
@@ -421,39 +531,39 @@ class SimpleJobScraper:
             # Construct full reply URL
             reply_url = base_url + data_href
             
-            self.logger.debug(f"Trying reply endpoint: {reply_url}")
+            self.logger.debug("Trying reply endpoint: %s", reply_url)
             
             # Make request to reply endpoint
-            response = requests.get(reply_url, headers=self.headers, timeout=10)
+            self.rate_limiters[city].acquire()
+            response = self.session.get(reply_url, timeout=(CONNECT_TIMEOUT, 10))
             
             if response.status_code == 200:
-                reply_soup = BeautifulSoup(response.content, 'html.parser')
+                reply_soup = self._make_soup(response)
                 
                 # Look for mailto links in the reply page
-                mailto_links = reply_soup.find_all('a', href=re.compile(r'mailto:', re.I))
+                mailto_links = reply_soup.find_all('a', href=MAILTO_HREF_RE)
                 for link in mailto_links:
                     href = link.get('href', '')
-                    email_match = re.search(r'mailto:([^?&\s]+)', href, re.I)
-                    if email_match:
-                        email = email_match.group(1).strip()
-                        self.logger.info(f"✅ Found reply email: {email}")
+                    email = self._mailto_address(href)
+                    if email:
+                        self.logger.debug("✅ Found reply email: %s", email)
                         return email
                 
                 # Look for emails in JavaScript or page content
                 page_text = response.text
                 
                 # Look for Craigslist anonymized emails
-                cl_email_matches = re.findall(r'[a-f0-9]{32}@job\.craigslist\.org', page_text)
-                if cl_email_matches:
-                    email = cl_email_matches[0]
-                    self.logger.info(f"✅ Found Craigslist anonymized email: {email}")
+                cl_email_match = CL_ANON_EMAIL_RE.search(page_text)
+                if cl_email_match:
+                    email = cl_email_match.group()
+                    self.logger.debug("✅ Found Craigslist anonymized email: %s", email)
                     return email
                 
                 # Look for any other email patterns
-                email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text)
+                email_matches = (match.group() for match in EMAIL_RE.finditer(page_text))
                 for email in email_matches:
                     if 'craigslist.org' not in email.lower() or '@job.craigslist.org' in email.lower():
-                        self.logger.info(f"✅ Found email in reply page: {email}")
+                        self.logger.debug("✅ Found email in reply page: %s", email)
                         return email
             
             return None
@@ -462,18 +572,14 @@ class SimpleJobScraper:
             self.logger.warning(f"⚠️  Error getting email from reply endpoint: {str(e)}")
             return None
 
-    def _get_real_anonymized_email(self, data_href: str, original_soup) -> Optional[str]:
+    def _get_real_anonymized_email(self, data_href: str, original_soup, city: str) -> Optional[str]:
         """Try to get the real Craigslist anonymized email"""
         try:
-            import time
-            
-            # Extract post ID from data_href for constructing potential email patterns
-            post_id_match = re.search(r'/(\d+)/', data_href)
-            if not post_id_match:
+            # Only reply buttons that carry a post ID lead anywhere
+            if not POST_ID_RE.search(data_href):
                 return None
             
-            post_id = post_id_match.group(1)
-            base_url = "https://vancouver.craigslist.org"
+            base_url = self.base_urls[city]
             
             # Try the contact/reply endpoint with POST method (simulates clicking reply)
             clean_href = data_href.replace('/__SERVICE_ID__', '')
@@ -481,66 +587,29 @@ class SimpleJobScraper:
             
             # Try POST request (like clicking reply button)
             try:
-                post_headers = {
-                    **self.headers,
-                    'X-Requested-With': 'XMLHttpRequest',
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                    'Accept': 'application/json, text/html, */*',
-                }
-                
                 # Try POST with minimal data
                 post_data = {'go': 'contact'}
-                response = requests.post(contact_url, headers=post_headers, data=post_data, timeout=5)
+                self.rate_limiters[city].acquire()
+                response = self.session.post(contact_url, headers=self.reply_headers, data=post_data, timeout=(CONNECT_TIMEOUT, 5))
                 
                 if response.status_code == 200:
                     content = response.text
                     
                     # Look for anonymized emails in response
-                    cl_emails = re.findall(r'[a-f0-9]{32}@job\.craigslist\.org', content)
-                    if cl_emails:
-                        self.logger.info(f"✅ Found real anonymized email via POST: {cl_emails[0]}")
-                        return cl_emails[0]
+                    cl_email_match = CL_ANON_EMAIL_RE.search(content)
+                    if cl_email_match:
+                        self.logger.debug("✅ Found real anonymized email via POST: %s", cl_email_match.group())
+                        return cl_email_match.group()
                     
                     # Look for any emails in the response
-                    email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
+                    email_matches = (match.group() for match in EMAIL_RE.finditer(content))
                     for email in email_matches:
                         if '@job.craigslist.org' in email.lower():
-                            self.logger.info(f"✅ Found Craigslist email via POST: {email}")
+                            self.logger.debug("✅ Found Craigslist email via POST: %s", email)
                             return email
                 
-            except Exception as e:
-                self.logger.debug(f"POST request failed: {str(e)}")
-            
-            # Try GET with different parameters
-            get_endpoints = [
-                f"{contact_url}?show=contact",
-                f"{contact_url}?action=contact", 
-                f"{base_url}/contact/{post_id}",
-                f"{base_url}/reply/{post_id}/contact",
-            ]
-            
-            for endpoint in get_endpoints:
-                try:
-                    response = requests.get(endpoint, headers=self.headers, timeout=5)
-                    if response.status_code == 200:
-                        content = response.text
-                        
-                        # Look for emails
-                        cl_emails = re.findall(r'[a-f0-9]{32}@job\.craigslist\.org', content)
-                        if cl_emails:
-                            self.logger.info(f"✅ Found anonymized email: {cl_emails[0]}")
-                            return cl_emails[0]
-                        
-                        any_cl_emails = re.findall(r'[a-zA-Z0-9._-]+@job\.craigslist\.org', content)
-                        if any_cl_emails:
-                            self.logger.info(f"✅ Found Craigslist email: {any_cl_emails[0]}")
-                            return any_cl_emails[0]
-                    
-                    time.sleep(0.3)  # Rate limiting
-                    
-                except Exception as e:
-                    self.logger.debug(f"GET endpoint {endpoint} failed: {str(e)}")
-                    continue
+            except requests.RequestException as e:
+                self.logger.debug("POST request failed: %s", e)
             
             return None
             
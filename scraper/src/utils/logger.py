@@ -21,6 +21,9 @@ def setup_logger(name: str = 'swipehire_scraper') -> logging.Logger:
     level = logging.DEBUG if debug_mode else logging.INFO
     logger.setLevel(level)
     
+    # Records are handled here only; don't hand them on to the root logger too
+    logger.propagate = False
+    
     # Create formatter
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
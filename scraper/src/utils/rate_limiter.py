@@ -0,0 +1,24 @@
+"""
+Rate limiter for SwipeHire Scraper
+"""
+
+import time
+import threading
+
+class RateLimiter:
+    """Hand out request permits at a fixed rate, shared across threads"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the next request slot is due"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        # Sleep outside the lock so other threads can reserve the following slots
+        time.sleep(slot - now)